@@ -1,7 +1,25 @@
 """
 Frank tools package entry.
 
-Provides convenience imports for CLI and API usage.
+Provides convenience imports for CLI and API usage. Subpackages are loaded
+on first attribute access so that ``import frank_tools`` stays cheap.
 """
 
-__all__ = ["download", "translate", "audio", "cli", "api"]
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+__all__ = ["download", "translate", "audio", "cli", "api", "profiling"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,15 +2,56 @@
 
 from __future__ import annotations
 
-from fastapi import FastAPI
+import itertools
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Optional
+
+from fastapi import FastAPI, Request, Response
 from pydantic import BaseModel
 
+from frank_tools import profiling
 from frank_tools.translate.google_free import GoogleTranslate
 
+logger = logging.getLogger(__name__)
+
 app = FastAPI(title="Frank tools", version="0.1.0")
 translator = GoogleTranslate()
 
 
+def install_profiling(target: FastAPI, trace_path: Optional[str] = None, max_spans: int = profiling.DEFAULT_MAX_SPANS) -> profiling.Tracer:
+    """
+    Opt-in profiling: time every request, expose it via ``Server-Timing`` and
+    log a span summary (plus an optional Chrome trace) on shutdown.
+
+    Only the latest ``max_spans`` spans are kept for the trace, and each request
+    is recorded on its own track so concurrent requests do not overlap.
+    """
+    tracer = profiling.enable(profiling.Tracer(max_spans=max_spans))
+    request_ids = itertools.count(1)
+
+    @target.middleware("http")
+    async def profile_request(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+        start = time.perf_counter_ns()
+        with profiling.track(next(request_ids)), tracer.span(f"http.{request.method} {request.url.path}"):
+            response = await call_next(request)
+        response.headers["Server-Timing"] = f"app;dur={(time.perf_counter_ns() - start) / 1e6:.3f}"
+        return response
+
+    async def dump_profile() -> None:
+        logger.info("Profile summary:\n%s", tracer.summary_table())
+        if trace_path:
+            tracer.write_chrome_trace(trace_path)
+
+    target.router.on_shutdown.append(dump_profile)
+    return tracer
+
+
+if os.environ.get("FRANK_TOOLS_PROFILE"):
+    install_profiling(app, trace_path=os.environ.get("FRANK_TOOLS_TRACE"))
+
+
 class TranslateRequest(BaseModel):
     text: str
     sl: str = "auto"
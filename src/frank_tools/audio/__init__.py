@@ -1,5 +1,17 @@
 """Audio helpers."""
 
-from .m4b_splitter import Chapter, M4BSplitter
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = ["Chapter", "M4BSplitter"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve exports lazily so importing the package does not load m4b_splitter.
+    if name in __all__:
+        value = getattr(importlib.import_module(".m4b_splitter", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,6 +10,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Sequence
 
+from frank_tools.profiling import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,7 +83,8 @@ class M4BSplitter:
             output_file = self._output_path_for_chapter(chapter)
             cmd = self.build_ffmpeg_command(self.input_path, output_file, chapter.start, chapter.end)
             logger.debug("Running command: %s", " ".join(cmd))
-            self._run_command(cmd)
+            with span("m4b.ffmpeg", chapter=chapter.title):
+                self._run_command(cmd)
             outputs.append(output_file)
         return outputs
 
@@ -3,18 +3,26 @@
 from __future__ import annotations
 
 import argparse
-from typing import Callable, Dict
+import os
+import sys
+from typing import Any, Callable, Dict
 
-from frank_tools.audio.m4b_splitter import M4BSplitter, parse_chapter_file
-from frank_tools.download.drive import download_file_from_link
-from frank_tools.translate.google_free import GoogleTranslate
+# Subcommand handlers import their implementation modules lazily so that
+# ``frank-tools --help`` and light subcommands do not pay for loading
+# ``requests``/``tqdm`` and friends. Keep module-level imports stdlib-only.
 
 
 def _add_drive_download(subparsers: argparse._SubParsersAction) -> None:
     parser = subparsers.add_parser("drive-download", help="Download a file from Google Drive")
     parser.add_argument("-l", "--link", required=True, help="Google Drive share link or ID")
     parser.add_argument("-o", "--output", default=".", help="Directory to save the download")
-    parser.set_defaults(func=_handle_drive_download)
+    # The daemon streams the whole file before replying, so wait as long as it takes.
+    parser.set_defaults(
+        func=_handle_drive_download,
+        daemon_params=_drive_download_params,
+        daemon_timeout=None,
+        daemon_notice="Download handed to the frank-tools daemon; progress is shown in the daemon's output.",
+    )
 
 
 def _add_translate(subparsers: argparse._SubParsersAction) -> None:
@@ -22,7 +30,7 @@ def _add_translate(subparsers: argparse._SubParsersAction) -> None:
     parser.add_argument("--text", required=True, help="Text to translate")
     parser.add_argument("--sl", default="auto", help="Source language")
     parser.add_argument("--tl", default="en", help="Target language")
-    parser.set_defaults(func=_handle_translate)
+    parser.set_defaults(func=_handle_translate, daemon_params=_translate_params)
 
 
 def _add_m4b_split(subparsers: argparse._SubParsersAction) -> None:
@@ -33,27 +41,53 @@ def _add_m4b_split(subparsers: argparse._SubParsersAction) -> None:
     parser.set_defaults(func=_handle_m4b_split)
 
 
+def _add_daemon(subparsers: argparse._SubParsersAction) -> None:
+    parser = subparsers.add_parser("daemon", help="Run a local daemon that keeps sessions and caches warm")
+    parser.add_argument("--stop", action="store_true", help="Stop a running daemon")
+    parser.set_defaults(func=_handle_daemon)
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="frank-tools", description="Frank tools CLI")
+    parser.add_argument("--profile", action="store_true", help="Print a timing summary of hot paths to stderr")
+    parser.add_argument("--trace", metavar="PATH", help="Write a Chrome trace (JSON) of timed spans to PATH")
+    parser.add_argument("--no-daemon", action="store_true", help="Always run in-process, even if a daemon is running")
+    parser.add_argument("--socket", default=None, help="Daemon Unix socket path (default: $FRANK_TOOLS_SOCKET or a per-user path)")
     subparsers = parser.add_subparsers(dest="command", required=True)
     _add_drive_download(subparsers)
     _add_translate(subparsers)
     _add_m4b_split(subparsers)
+    _add_daemon(subparsers)
     return parser
 
 
+def _drive_download_params(args: argparse.Namespace) -> Dict[str, Any]:
+    # The daemon has its own working directory, so send an absolute output path.
+    return {"link": args.link, "output": os.path.abspath(args.output)}
+
+
+def _translate_params(args: argparse.Namespace) -> Dict[str, Any]:
+    return {"text": args.text, "sl": args.sl, "tl": args.tl}
+
+
 def _handle_drive_download(args: argparse.Namespace) -> None:
+    from frank_tools.download.drive import download_file_from_link
+
     dest = download_file_from_link(args.link, output_dir=args.output)
     print(f"Downloaded to: {dest}")
 
 
 def _handle_translate(args: argparse.Namespace) -> None:
+    from frank_tools.translate.google_free import GoogleTranslate
+
     translator = GoogleTranslate()
     result = translator.translate(args.text, sl=args.sl, tl=args.tl)
     print(result["translation"])
 
 
 def _handle_m4b_split(args: argparse.Namespace) -> None:
+    from frank_tools.audio.m4b_splitter import M4BSplitter, parse_chapter_file
+
     manifest = parse_chapter_file(args.chapters)
     splitter = M4BSplitter.from_manifest(args.input, manifest, output_dir=args.output)
     outputs = splitter.split()
@@ -61,11 +95,87 @@ def _handle_m4b_split(args: argparse.Namespace) -> None:
         print(out)
 
 
+def _handle_daemon(args: argparse.Namespace) -> None:
+    if args.stop:
+        from frank_tools.daemon.client import request
+
+        request("shutdown", socket_path=args.socket)
+        print("Daemon stopped")
+        return
+
+    import logging
+
+    from frank_tools.daemon.server import serve
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    serve(args.socket)
+
+
+def _forward_to_daemon(args: argparse.Namespace) -> bool:
+    """
+    Run the command in a running daemon, if any. Returns False when the caller
+    should fall back to in-process execution.
+    """
+    params_builder = getattr(args, "daemon_params", None)
+    if params_builder is None or args.no_daemon or args.profile or args.trace:
+        return False
+
+    from frank_tools.daemon.client import DEFAULT_TIMEOUT, DaemonUnavailable, request
+
+    notice = getattr(args, "daemon_notice", None)
+    try:
+        output = request(
+            args.command,
+            params_builder(args),
+            socket_path=args.socket,
+            timeout=getattr(args, "daemon_timeout", DEFAULT_TIMEOUT),
+            on_connect=(lambda: print(notice, file=sys.stderr)) if notice else None,
+        )
+    except DaemonUnavailable:
+        return False
+    for line in output:
+        print(line)
+    return True
+
+
+def _describe_error(exc: Exception) -> str:
+    from frank_tools.daemon.client import DaemonError
+
+    # Commands failing inside the daemon already arrive as "<ExceptionType>: <message>".
+    if isinstance(exc, DaemonError):
+        return str(exc)
+    return f"{type(exc).__name__}: {exc}"
+
+
+def _run_in_process(args: argparse.Namespace) -> None:
+    handler: Callable[[argparse.Namespace], None] = args.func
+    if not (args.profile or args.trace):
+        handler(args)
+        return
+
+    from frank_tools import profiling
+
+    # Bounded: a large drive-download records two spans per chunk. Summary totals stay complete.
+    tracer = profiling.enable(profiling.Tracer(max_spans=profiling.DEFAULT_MAX_SPANS))
+    try:
+        with profiling.span(f"cli.{args.command}"):
+            handler(args)
+    finally:
+        profiling.disable()
+        if args.profile:
+            print(tracer.summary_table(), file=sys.stderr)
+        if args.trace:
+            tracer.write_chrome_trace(args.trace)
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = build_parser()
     args = parser.parse_args(argv)
-    handler: Callable[[argparse.Namespace], None] = args.func
-    handler(args)
+    try:
+        if not _forward_to_daemon(args):
+            _run_in_process(args)
+    except Exception as exc:  # same one-line error whether the command ran here or in the daemon
+        parser.exit(1, f"{parser.prog}: error: {_describe_error(exc)}\n")
 
 
 if __name__ == "__main__":
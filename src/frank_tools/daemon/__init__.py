@@ -0,0 +1,27 @@
+"""Long-lived local daemon that keeps sessions and caches warm between CLI calls."""
+
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    "DaemonError": "client",
+    "DaemonUnavailable": "client",
+    "default_socket_path": "client",
+    "request": "client",
+    "DaemonServer": "server",
+    "DaemonService": "server",
+    "serve": "server",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    # The CLI imports the client on every call; only load the server (and requests) when asked for.
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,102 @@
+"""Client side of the Frank tools daemon protocol.
+
+Requests and replies are single JSON documents terminated by a newline, sent
+over a Unix domain socket. This module must stay stdlib-only: it is imported
+on every CLI invocation.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+SOCKET_ENV_VAR = "FRANK_TOOLS_SOCKET"
+CONNECT_TIMEOUT = 1.0
+DEFAULT_TIMEOUT = 30.0
+
+
+class DaemonError(RuntimeError):
+    """Raised when the daemon reports a failure for a request."""
+
+
+class DaemonUnavailable(DaemonError):
+    """Raised when no daemon is listening on the socket."""
+
+
+def default_socket_path() -> Path:
+    """
+    Resolve the daemon socket: ``$FRANK_TOOLS_SOCKET``, then ``$XDG_RUNTIME_DIR``,
+    then a private per-user directory in the temp directory (created by the server).
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "frank-tools.sock"
+    return private_socket_dir() / "daemon.sock"
+
+
+def private_socket_dir() -> Path:
+    """Per-user fallback directory for the socket; the server creates it with mode 0700."""
+    import tempfile  # only needed here; keep it off the per-call CLI import path
+
+    return Path(tempfile.gettempdir()) / f"frank-tools-{os.getuid()}"
+
+
+def request(
+    command: str,
+    params: Optional[Dict[str, Any]] = None,
+    socket_path: Path | str | None = None,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    on_connect: Optional[Callable[[], None]] = None,
+) -> List[str]:
+    """
+    Send ``command`` to the daemon and return the output lines it produced.
+
+    Raises ``DaemonUnavailable`` when no daemon owned by the current user accepts
+    the connection within ``CONNECT_TIMEOUT``, and ``DaemonError`` when the
+    command fails or no reply arrives within ``timeout`` seconds (``None`` waits
+    indefinitely). ``on_connect`` runs once the daemon has accepted the request.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        raise DaemonUnavailable("Unix domain sockets are not supported on this platform")
+    path = str(socket_path or default_socket_path())
+
+    # Never talk to a socket another user could have planted.
+    try:
+        owner = os.stat(path).st_uid
+    except OSError as exc:
+        raise DaemonUnavailable(f"No daemon listening on {path}: {exc}") from exc
+    if owner != os.getuid():
+        raise DaemonUnavailable(f"Refusing to use {path}: it is owned by another user")
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(path)
+    except OSError as exc:
+        sock.close()
+        raise DaemonUnavailable(f"No daemon listening on {path}: {exc}") from exc
+
+    if on_connect is not None:
+        on_connect()
+    sock.settimeout(timeout)
+    try:
+        with sock, sock.makefile("rb") as reader:
+            sock.sendall(json.dumps({"command": command, "params": params or {}}).encode("utf-8") + b"\n")
+            line = reader.readline()
+    except socket.timeout as exc:
+        raise DaemonError(f"Daemon did not reply within {timeout:g}s") from exc
+    except OSError as exc:
+        raise DaemonError(f"Lost connection to daemon: {exc}") from exc
+
+    if not line:
+        raise DaemonError("Daemon closed the connection without replying")
+    reply = json.loads(line)
+    if not reply.get("ok"):
+        raise DaemonError(reply.get("error", "Unknown daemon error"))
+    return list(reply.get("output", []))
@@ -0,0 +1,193 @@
+"""Unix socket server that executes CLI commands with warm sessions and caches."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import logging
+import os
+import queue
+import socketserver
+import stat
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Iterator, List, Tuple, TypeVar
+
+import requests
+
+from frank_tools.daemon.client import DaemonError, DaemonUnavailable, default_socket_path, private_socket_dir, request
+from frank_tools.download.drive import download_file_by_id, extract_file_id
+from frank_tools.translate.google_free import GoogleTranslate
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Pool(Generic[T]):
+    """
+    Hands each request thread exclusive use of an object, reusing idle ones so
+    their connection pools stay warm. ``requests.Session`` is not thread-safe.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        self._factory = factory
+        self._idle: "queue.LifoQueue[T]" = queue.LifoQueue()
+
+    @contextlib.contextmanager
+    def acquire(self) -> Iterator[T]:
+        try:
+            item = self._idle.get_nowait()
+        except queue.Empty:
+            item = self._factory()
+        try:
+            yield item
+        finally:
+            self._idle.put(item)
+
+
+class DaemonService:
+    """
+    Long-lived command implementations backed by pools of warm translators and
+    Drive sessions plus a bounded translation cache shared across requests.
+    """
+
+    def __init__(self, cache_size: int = 1024):
+        self.translators: _Pool[GoogleTranslate] = _Pool(GoogleTranslate)
+        self.drive_sessions: _Pool[requests.Session] = _Pool(requests.Session)
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str, str], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.commands: Dict[str, Callable[..., List[str]]] = {
+            "ping": self.ping,
+            "translate": self.translate,
+            "drive-download": self.drive_download,
+        }
+
+    def handle(self, command: str, params: Dict[str, Any]) -> List[str]:
+        try:
+            func = self.commands[command]
+        except KeyError:
+            raise ValueError(f"Unknown command: {command}") from None
+        return func(**params)
+
+    def ping(self) -> List[str]:
+        return ["pong"]
+
+    def translate(self, text: str, sl: str = "auto", tl: str = "en") -> List[str]:
+        key = (text, sl, tl)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return [self._cache[key]]
+        with self.translators.acquire() as translator:
+            translation = translator.translate(text, sl=sl, tl=tl)["translation"]
+        with self._lock:
+            self._cache[key] = translation
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return [translation]
+
+    def drive_download(self, link: str, output: str = ".") -> List[str]:
+        file_id = extract_file_id(link)
+        with self.drive_sessions.acquire() as session:
+            try:
+                dest = download_file_by_id(file_id, session=session, output_dir=output)
+            finally:
+                # Drop per-file state such as the download_warning confirm cookie.
+                session.cookies.clear()
+        return [f"Downloaded to: {dest}"]
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: "DaemonServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        shutdown = False
+        try:
+            message = json.loads(line)
+            command = message["command"]
+            if command == "shutdown":
+                reply: Dict[str, Any] = {"ok": True, "output": []}
+                shutdown = True
+            else:
+                reply = {"ok": True, "output": self.server.service.handle(command, message.get("params", {}))}
+        except Exception as exc:  # report every failure back to the client instead of dropping the connection
+            logger.exception("Daemon request failed")
+            reply = {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        self.wfile.write(json.dumps(reply).encode("utf-8") + b"\n")
+        self.wfile.flush()
+        if shutdown:
+            # Only stop once the reply is on the wire; serve_forever runs in another thread.
+            self.server.shutdown()
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    # Let in-flight requests finish before serve() returns and the process exits.
+    daemon_threads = False
+    block_on_close = True
+
+    def __init__(self, socket_path: Path | str, service: DaemonService):
+        self.service = service
+        super().__init__(str(socket_path), _RequestHandler)
+
+    def server_bind(self) -> None:
+        # Create the socket as 0600 from the start; a chmod after bind leaves a window
+        # in which other users can connect when the path is in a shared directory.
+        old_umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(old_umask)
+
+
+def _ensure_private_dir(directory: Path) -> None:
+    """
+    Create the per-user socket directory with mode 0700, refusing directories
+    owned by someone else or accessible to other users.
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = directory.stat()
+    if info.st_uid != os.getuid() or stat.S_IMODE(info.st_mode) & 0o077:
+        raise RuntimeError(f"Refusing to use {directory}: it must be owned by the current user with mode 0700")
+
+
+def _remove_stale_socket(path: Path) -> None:
+    try:
+        info = path.lstat()
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(info.st_mode):
+        raise RuntimeError(f"Refusing to replace {path}: it exists and is not a socket")
+    if info.st_uid != os.getuid():
+        raise RuntimeError(f"Refusing to replace {path}: it is owned by another user")
+    try:
+        request("ping", socket_path=path, timeout=5.0)
+    except DaemonUnavailable:
+        path.unlink()
+        return
+    except DaemonError as exc:
+        raise RuntimeError(f"A daemon on {path} is not responding: {exc}") from exc
+    raise RuntimeError(f"A daemon is already running on {path}")
+
+
+def serve(socket_path: Path | str | None = None, service: DaemonService | None = None) -> None:
+    """
+    Serve requests on ``socket_path`` until a ``shutdown`` command or interrupt.
+    """
+    path = Path(socket_path or default_socket_path())
+    if path.parent == private_socket_dir():
+        _ensure_private_dir(path.parent)
+    _remove_stale_socket(path)
+    with DaemonServer(path, service or DaemonService()) as server:
+        logger.info("Frank tools daemon listening on %s", path)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            path.unlink(missing_ok=True)
@@ -1,5 +1,17 @@
 """Download utilities."""
 
-from .drive import download_file_from_link
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = ["download_file_from_link"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve exports lazily so importing the package does not load drive.
+    if name in __all__:
+        value = getattr(importlib.import_module(".drive", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
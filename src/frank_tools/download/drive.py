@@ -10,6 +10,8 @@ from typing import Optional
 import requests
 from tqdm import tqdm
 
+from frank_tools.profiling import span
+
 CONFIRM_TOKEN_PREFIX = "download_warning"
 DOWNLOAD_URL = "https://docs.google.com/uc?export=download"
 CHUNK_SIZE = 32768
@@ -50,10 +52,17 @@ def get_file_name(response: requests.Response, default: str = "downloaded_file")
 def save_response_content(response: requests.Response, destination: Path) -> Path:
     """Stream response content into a file."""
     destination.parent.mkdir(parents=True, exist_ok=True)
+    chunks = iter(tqdm(response.iter_content(CHUNK_SIZE), desc="Downloading", unit="chunk"))
     with destination.open("wb") as f:
-        for chunk in tqdm(response.iter_content(CHUNK_SIZE), desc="Downloading", unit="chunk"):
+        while True:
+            # Separate spans for the network read and the disk write of each chunk.
+            with span("drive.read_chunk"):
+                chunk = next(chunks, None)
+            if chunk is None:
+                break
             if chunk:
-                f.write(chunk)
+                with span("drive.write_chunk", size=len(chunk)):
+                    f.write(chunk)
     return destination
 
 
@@ -64,14 +73,17 @@ def download_file_by_id(file_id: str, session: Optional[requests.Session] = None
     output_dir = Path(output_dir)
     session = session or requests.Session()
 
-    response = session.get(DOWNLOAD_URL, params={"id": file_id}, stream=True)
+    with span("drive.request", file_id=file_id):
+        response = session.get(DOWNLOAD_URL, params={"id": file_id}, stream=True)
     token = get_confirm_token(response)
 
     if token:
-        response = session.get(DOWNLOAD_URL, params={"id": file_id, "confirm": token}, stream=True)
+        with span("drive.request", file_id=file_id, confirm=True):
+            response = session.get(DOWNLOAD_URL, params={"id": file_id, "confirm": token}, stream=True)
 
     destination = output_dir / get_file_name(response)
-    return save_response_content(response, destination)
+    with span("drive.save_response_content", destination=destination):
+        return save_response_content(response, destination)
 
 
 def download_file_from_link(link: str, output_dir: Path | str = ".") -> Path:
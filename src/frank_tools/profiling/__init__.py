@@ -0,0 +1,5 @@
+"""Lightweight timing spans for profiling hot paths."""
+
+from .tracer import DEFAULT_MAX_SPANS, Span, Tracer, disable, enable, get_tracer, span, track
+
+__all__ = ["DEFAULT_MAX_SPANS", "Span", "Tracer", "disable", "enable", "get_tracer", "span", "track"]
@@ -0,0 +1,151 @@
+"""Span recorder with summary and Chrome trace output."""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, ContextManager, Deque, Dict, Iterator, List, Optional
+
+# Enough for a detailed trace while keeping memory and trace files bounded on long runs.
+DEFAULT_MAX_SPANS = 100_000
+_NULL_SPAN = contextlib.nullcontext()
+_tracer: Optional["Tracer"] = None
+_track: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar("frank_tools_track", default=None)
+
+
+@dataclass
+class Span:
+    """
+    A single timed region, with timings stored in nanoseconds.
+    """
+
+    name: str
+    start_ns: int
+    duration_ns: int
+    track_id: int
+    args: Dict[str, Any] = field(default_factory=dict)
+
+
+class Tracer:
+    """
+    Collects spans and renders them as a summary table or a Chrome trace.
+
+    With ``max_spans`` only the most recent spans are kept for the trace; the
+    summary still covers every span recorded.
+    """
+
+    def __init__(self, max_spans: Optional[int] = None) -> None:
+        self.spans: Deque[Span] = deque(maxlen=max_spans)
+        self.origin_ns = time.perf_counter_ns()
+        self._totals: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args: Any) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            end = time.perf_counter_ns()
+            track_id = _track.get()
+            if track_id is None:
+                track_id = threading.get_ident()
+            record = Span(name=name, start_ns=start - self.origin_ns, duration_ns=end - start, track_id=track_id, args=args)
+            with self._lock:
+                self.spans.append(record)
+                row = self._totals.setdefault(name, {"name": name, "count": 0, "total_ns": 0, "max_ns": 0})
+                row["count"] += 1
+                row["total_ns"] += record.duration_ns
+                row["max_ns"] = max(row["max_ns"], record.duration_ns)
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """
+        Aggregate spans by name, sorted by total time (slowest first).
+        """
+        with self._lock:
+            rows = [dict(row) for row in self._totals.values()]
+        return sorted(rows, key=lambda row: row["total_ns"], reverse=True)
+
+    def summary_table(self) -> str:
+        rows = self.summary()
+        width = max([len("span")] + [len(row["name"]) for row in rows])
+        lines = [f"{'span':<{width}}  {'count':>7}  {'total ms':>10}  {'mean ms':>10}  {'max ms':>10}"]
+        for row in rows:
+            total_ms = row["total_ns"] / 1e6
+            lines.append(
+                f"{row['name']:<{width}}  {row['count']:>7}  {total_ms:>10.3f}  {total_ms / row['count']:>10.3f}  {row['max_ns'] / 1e6:>10.3f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        Return spans in the Chrome trace event format (load via chrome://tracing or Perfetto).
+        """
+        pid = os.getpid()
+        events = [
+            {
+                "name": record.name,
+                "ph": "X",
+                "ts": record.start_ns / 1000.0,
+                "dur": record.duration_ns / 1000.0,
+                "pid": pid,
+                "tid": record.track_id,
+                "args": {key: str(value) for key, value in record.args.items()},
+            }
+            for record in sorted(list(self.spans), key=lambda record: record.start_ns)
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: Path | str) -> Path:
+        destination = Path(path)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return destination
+
+
+def span(name: str, **args: Any) -> ContextManager[None]:
+    """
+    Time a block under ``name`` when tracing is enabled; a shared no-op context otherwise.
+    """
+    if _tracer is None:
+        return _NULL_SPAN
+    return _tracer.span(name, **args)
+
+
+@contextlib.contextmanager
+def track(track_id: int) -> Iterator[None]:
+    """
+    Record spans opened in this context (including child asyncio tasks) under
+    ``track_id`` instead of the thread id, so concurrent requests on one event
+    loop get separate rows in the Chrome trace.
+    """
+    token = _track.set(track_id)
+    try:
+        yield
+    finally:
+        _track.reset(token)
+
+
+def enable(tracer: Optional[Tracer] = None) -> Tracer:
+    """Start recording spans into ``tracer`` (or a fresh one) and return it."""
+    global _tracer
+    _tracer = tracer or Tracer()
+    return _tracer
+
+
+def disable() -> Optional[Tracer]:
+    """Stop recording spans and return the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def get_tracer() -> Optional[Tracer]:
+    return _tracer
@@ -1,5 +1,17 @@
 """Translation utilities."""
 
-from .google_free import GoogleTranslate
+from __future__ import annotations
+
+import importlib
+from typing import Any
 
 __all__ = ["GoogleTranslate"]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve exports lazily so importing the package does not load google_free.
+    if name in __all__:
+        value = getattr(importlib.import_module(".google_free", __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,6 +9,8 @@ from urllib.parse import quote
 
 import requests
 
+from frank_tools.profiling import span
+
 
 @dataclass
 class TranslationResult:
@@ -83,10 +85,12 @@ class GoogleTranslate:
 
     def translate(self, text: str, sl: str = "auto", tl: str = "en", hl: Optional[str] = None, no_autocorrect: bool = False) -> Dict[str, Any]:
         url = self._request_url(text, sl=sl, tl=tl, hl=hl, no_autocorrect=no_autocorrect)
-        response = self.session.get(url, timeout=20)
-        response.raise_for_status()
-        data = response.json()
-        parsed = self.parse_translation_payload(data, fallback_text=text)
+        with span("translate.request", host=self.host):
+            response = self.session.get(url, timeout=20)
+            response.raise_for_status()
+        with span("translate.parse"):
+            data = response.json()
+            parsed = self.parse_translation_payload(data, fallback_text=text)
         return {
             "translation": parsed.translation,
             "original": parsed.original,
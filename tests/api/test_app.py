@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from frank_tools import profiling  # noqa: E402
+from frank_tools.api.app import install_profiling  # noqa: E402
+
+
+@pytest.fixture
+def profiled_app(tmp_path):
+    target = FastAPI()
+
+    @target.get("/work")
+    async def work() -> dict[str, str]:
+        with profiling.span("work"):
+            return {"status": "ok"}
+
+    trace = tmp_path / "trace.json"
+    tracer = install_profiling(target, trace_path=str(trace), max_spans=3)
+    yield target, tracer, trace
+    profiling.disable()
+
+
+def test_profiling_middleware_sets_server_timing_and_dumps_trace(profiled_app):
+    target, tracer, trace = profiled_app
+    with TestClient(target) as client:
+        responses = [client.get("/work") for _ in range(3)]
+
+    assert all(r.headers["Server-Timing"].startswith("app;dur=") for r in responses)
+    summary = {row["name"]: row["count"] for row in tracer.summary()}
+    assert summary == {"http.GET /work": 3, "work": 3}
+    # The buffer keeps only the latest spans, but the summary counts all of them.
+    assert len(tracer.spans) == 3
+
+    events = json.loads(trace.read_text())["traceEvents"]
+    by_name = {}
+    for event in events:
+        by_name.setdefault(event["name"], []).append(event["tid"])
+    # Spans inside a request share that request's track.
+    assert by_name["work"][-1] == by_name["http.GET /work"][-1]
+    assert len(set(by_name["work"])) == len(by_name["work"])
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+from frank_tools import profiling
 from frank_tools.audio.m4b_splitter import Chapter, M4BSplitter
 
 
@@ -37,3 +38,17 @@ def test_split_invokes_run_command(monkeypatch, tmp_path):
     assert len(outputs) == 2
     assert outputs[0].name.startswith("01_")
     assert called and len(called) == 2
+
+
+def test_split_records_ffmpeg_spans(monkeypatch, tmp_path):
+    chapters = [Chapter("One", 0.0, 1.0, num=1), Chapter("Two", 1.0, 2.0, num=2)]
+    splitter = M4BSplitter("input.m4b", chapters, output_dir=tmp_path)
+    monkeypatch.setattr(splitter, "_run_command", lambda cmd: None)
+
+    tracer = profiling.enable()
+    try:
+        splitter.split()
+    finally:
+        profiling.disable()
+
+    assert [(s.name, s.args["chapter"]) for s in tracer.spans] == [("m4b.ffmpeg", "One"), ("m4b.ffmpeg", "Two")]
@@ -1,7 +1,11 @@
 import importlib
+import json
 from pathlib import Path
 
 cli_main = importlib.import_module("frank_tools.cli.main")
+drive = importlib.import_module("frank_tools.download.drive")
+google_free = importlib.import_module("frank_tools.translate.google_free")
+m4b_splitter = importlib.import_module("frank_tools.audio.m4b_splitter")
 
 
 def test_drive_download_dispatch(monkeypatch, capsys, tmp_path):
@@ -12,7 +16,7 @@ def test_drive_download_dispatch(monkeypatch, capsys, tmp_path):
         captured["output_dir"] = output_dir
         return tmp_path / "file.bin"
 
-    monkeypatch.setattr(cli_main, "download_file_from_link", fake_download)
+    monkeypatch.setattr(drive, "download_file_from_link", fake_download)
     cli_main.main(["drive-download", "--link", "abc123", "--output", str(tmp_path)])
 
     out = capsys.readouterr().out
@@ -26,14 +30,14 @@ def test_translate_dispatch(monkeypatch, capsys):
         def translate(self, text, sl="auto", tl="en"):
             return {"translation": f"{text}-{tl}", "src_lang": sl}
 
-    monkeypatch.setattr(cli_main, "GoogleTranslate", FakeTranslator)
+    monkeypatch.setattr(google_free, "GoogleTranslate", FakeTranslator)
     cli_main.main(["translate", "--text", "hola", "--tl", "en"])
     out = capsys.readouterr().out
     assert "hola-en" in out
 
 
 def test_m4b_split_dispatch(monkeypatch, capsys, tmp_path):
-    monkeypatch.setattr(cli_main, "parse_chapter_file", lambda path: [("One", 0.0, 1.0)])
+    monkeypatch.setattr(m4b_splitter, "parse_chapter_file", lambda path: [("One", 0.0, 1.0)])
 
     class FakeSplitter:
         @classmethod
@@ -43,7 +47,43 @@ def test_m4b_split_dispatch(monkeypatch, capsys, tmp_path):
         def split(self):
             return [tmp_path / "01_One.m4a"]
 
-    monkeypatch.setattr(cli_main, "M4BSplitter", FakeSplitter)
+    monkeypatch.setattr(m4b_splitter, "M4BSplitter", FakeSplitter)
     cli_main.main(["m4b-split", "--input", "file.m4b", "--chapters", "chapters.txt", "--output", str(tmp_path)])
     out = capsys.readouterr().out
     assert "01_One.m4a" in out
+
+
+def test_profile_and_trace_options(monkeypatch, capsys, tmp_path):
+    class FakeSplitter:
+        def split(self):
+            return [tmp_path / "01_One.m4a"]
+
+    monkeypatch.setattr(m4b_splitter, "parse_chapter_file", lambda path: [("One", 0.0, 1.0)])
+    monkeypatch.setattr(m4b_splitter.M4BSplitter, "from_manifest", classmethod(lambda cls, *a, **kw: FakeSplitter()))
+    trace = tmp_path / "trace.json"
+    cli_main.main(["--profile", "--trace", str(trace), "m4b-split", "--input", "file.m4b", "--chapters", "chapters.txt"])
+
+    err = capsys.readouterr().err
+    assert "cli.m4b-split" in err
+    events = json.loads(trace.read_text())["traceEvents"]
+    assert events[0]["name"] == "cli.m4b-split"
+
+
+def test_profile_tracer_is_bounded(monkeypatch, capsys):
+    profiling = importlib.import_module("frank_tools.profiling")
+    tracers = []
+    real_enable = profiling.enable
+
+    def recording_enable(tracer=None):
+        tracers.append(real_enable(tracer))
+        return tracers[-1]
+
+    monkeypatch.setattr(profiling, "enable", recording_enable)
+    class FakeTranslator:
+        def translate(self, text, sl="auto", tl="en"):
+            return {"translation": text}
+
+    monkeypatch.setattr(google_free, "GoogleTranslate", FakeTranslator)
+    cli_main.main(["--profile", "translate", "--text", "hola"])
+
+    assert tracers[0].spans.maxlen == profiling.DEFAULT_MAX_SPANS
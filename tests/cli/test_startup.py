@@ -0,0 +1,73 @@
+"""Startup-time guard for the CLI, based on ``python -X importtime``."""
+
+import compileall
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+# Modules that must only be loaded once a subcommand that needs them runs.
+HEAVY_MODULES = (
+    "requests",
+    "tqdm",
+    "urllib3",
+    "fastapi",
+    "tempfile",
+    "frank_tools.download.drive",
+    "frank_tools.translate.google_free",
+)
+
+
+def _imported_modules(*args: str) -> dict[str, int]:
+    """Run the interpreter with ``-X importtime`` and return cumulative microseconds per module."""
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    modules: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = (part.strip() for part in line[len("import time:") :].split("|"))
+        if cumulative.isdigit():
+            modules[name] = max(modules.get(name, 0), int(cumulative))
+    return modules
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ("-c", "import frank_tools.cli.main"),
+        ("-c", "import frank_tools, frank_tools.download, frank_tools.translate, frank_tools.audio"),
+        ("-m", "frank_tools.cli.main", "--help"),
+        ("-m", "frank_tools.cli.main", "m4b-split", "--help"),
+        ("-c", "import frank_tools.daemon.client"),
+    ],
+)
+def test_startup_does_not_import_heavy_modules(args):
+    # Ignore whatever the bare interpreter already loads (site/.pth hooks may pull in tempfile).
+    baseline = _imported_modules("-c", "pass")
+    modules = _imported_modules(*args)
+    loaded = sorted(name for name in modules if name in HEAVY_MODULES and name not in baseline)
+    assert loaded == []
+
+
+def test_cli_import_time_budget():
+    # argparse dominates the CLI import; measure against it in the same run so the
+    # budget tracks this machine's speed. Anything heavy (requests, tqdm, ...) blows it.
+    # Compile up front (installed wheels ship bytecode) and take the best of three runs,
+    # so neither source compilation nor scheduler noise is counted.
+    compileall.compile_dir(str(SRC), quiet=1)
+    ratios = []
+    for _ in range(3):
+        modules = _imported_modules("-c", "import frank_tools.cli.main")
+        ratios.append(modules["frank_tools.cli.main"] / modules["argparse"])
+    assert min(ratios) < 2
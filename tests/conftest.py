@@ -3,7 +3,15 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parent.parent
 SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_daemon_socket(monkeypatch, tmp_path):
+    """Keep CLI tests from forwarding to a daemon running on the developer's machine."""
+    monkeypatch.setenv("FRANK_TOOLS_SOCKET", str(tmp_path / "no-daemon.sock"))
@@ -0,0 +1,213 @@
+import importlib
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from frank_tools.daemon import client, server
+
+cli_main = importlib.import_module("frank_tools.cli.main")
+SRC = Path(__file__).resolve().parents[2] / "src"
+
+
+class CountingTranslator:
+    calls = 0
+
+    def translate(self, text, sl="auto", tl="en"):
+        type(self).calls += 1
+        return {"translation": f"{text}-{tl}", "src_lang": sl}
+
+
+def _wait_for(path: Path) -> None:
+    for _ in range(1000):
+        try:
+            client.request("ping", socket_path=path)
+            return
+        except client.DaemonUnavailable:
+            time.sleep(0.01)
+    raise AssertionError(f"No daemon came up on {path}")
+
+
+@pytest.fixture
+def short_socket_path(monkeypatch):
+    # AF_UNIX paths are limited to ~100 bytes, so avoid pytest's long tmp_path.
+    directory = Path(tempfile.mkdtemp(prefix="ft-"))
+    socket_path = directory / "d.sock"
+    monkeypatch.setenv("FRANK_TOOLS_SOCKET", str(socket_path))
+    yield socket_path
+    socket_path.unlink(missing_ok=True)
+    directory.rmdir()
+
+
+@pytest.fixture
+def running_daemon(monkeypatch, short_socket_path):
+    monkeypatch.setattr(server, "GoogleTranslate", CountingTranslator)
+    monkeypatch.setattr(CountingTranslator, "calls", 0)
+    thread = threading.Thread(target=server.serve, args=(short_socket_path, server.DaemonService()), daemon=True)
+    thread.start()
+    _wait_for(short_socket_path)
+    yield short_socket_path
+    client.request("shutdown", socket_path=short_socket_path)
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert not short_socket_path.exists()
+
+
+def test_request_without_daemon_raises_unavailable(tmp_path):
+    with pytest.raises(client.DaemonUnavailable):
+        client.request("ping", socket_path=tmp_path / "missing.sock")
+
+
+def test_request_refuses_socket_owned_by_another_user(running_daemon, monkeypatch):
+    other_uid = os.getuid() + 1
+    with monkeypatch.context() as patch:
+        patch.setattr(client.os, "getuid", lambda: other_uid)
+        with pytest.raises(client.DaemonUnavailable, match="another user"):
+            client.request("ping")
+
+
+def test_request_times_out_on_silent_listener(short_socket_path):
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    with listener:
+        listener.bind(str(short_socket_path))
+        listener.listen(1)
+        started = time.monotonic()
+        with pytest.raises(client.DaemonError, match="did not reply"):
+            client.request("ping", timeout=0.2)
+        assert time.monotonic() - started < 2
+
+
+def test_private_socket_dir_is_rejected_when_shared(tmp_path):
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    with pytest.raises(RuntimeError, match="0700"):
+        server._ensure_private_dir(shared)
+
+    private = tmp_path / "private"
+    server._ensure_private_dir(private)
+    assert private.stat().st_mode & 0o777 == 0o700
+
+
+def test_translate_is_cached_across_requests(running_daemon):
+    assert client.request("translate", {"text": "hola", "tl": "en"}) == ["hola-en"]
+    assert client.request("translate", {"text": "hola", "tl": "en"}) == ["hola-en"]
+    assert CountingTranslator.calls == 1
+
+
+def test_unknown_command_reports_error(running_daemon):
+    with pytest.raises(client.DaemonError, match="Unknown command"):
+        client.request("nope")
+
+
+def test_cli_forwards_to_running_daemon(running_daemon, capsys):
+    cli_main.main(["translate", "--text", "hola", "--tl", "fr"])
+    cli_main.main(["translate", "--text", "hola", "--tl", "fr"])
+    assert capsys.readouterr().out.splitlines() == ["hola-fr", "hola-fr"]
+    assert CountingTranslator.calls == 1
+
+
+def test_cli_socket_option_selects_daemon(running_daemon, monkeypatch, capsys):
+    monkeypatch.setenv("FRANK_TOOLS_SOCKET", str(running_daemon.parent / "other.sock"))
+    cli_main.main(["--socket", str(running_daemon), "translate", "--text", "hola"])
+    assert capsys.readouterr().out.strip() == "hola-en"
+    assert CountingTranslator.calls == 1
+
+
+def test_cli_no_daemon_runs_in_process(running_daemon, monkeypatch, capsys):
+    google_free = importlib.import_module("frank_tools.translate.google_free")
+    monkeypatch.setattr(google_free, "GoogleTranslate", CountingTranslator)
+    cli_main.main(["--no-daemon", "translate", "--text", "hola"])
+    assert capsys.readouterr().out.strip() == "hola-en"
+    assert CountingTranslator.calls == 1
+
+
+@pytest.mark.parametrize("use_daemon", [True, False])
+def test_cli_errors_match_with_and_without_daemon(request, use_daemon, capsys):
+    if use_daemon:
+        request.getfixturevalue("running_daemon")
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main.main(["drive-download", "--link", "https://drive.google.com/file/x/invalid"])
+    assert excinfo.value.code == 1
+    # The forwarded path also prints the "handed to the daemon" notice first.
+    last_line = capsys.readouterr().err.splitlines()[-1]
+    assert last_line == "frank-tools: error: ValueError: Invalid Google Drive link format. Could not extract file ID."
+
+
+def test_cli_daemon_stop_without_daemon_exits_cleanly(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main.main(["daemon", "--stop"])
+    assert excinfo.value.code == 1
+    err = capsys.readouterr().err
+    assert err.startswith("frank-tools: error: No daemon listening on") and err.count("\n") == 1
+
+
+def test_cli_second_daemon_exits_cleanly(running_daemon, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main.main(["daemon"])
+    assert excinfo.value.code == 1
+    assert "already running" in capsys.readouterr().err
+
+
+def test_cli_stop_replies_before_daemon_process_exits(short_socket_path, capsys):
+    # Run the daemon as its own process: exiting must not cut off the --stop reply.
+    env = dict(os.environ, PYTHONPATH=str(SRC))
+    for _ in range(3):
+        proc = subprocess.Popen([sys.executable, "-m", "frank_tools.cli.main", "daemon"], env=env, stderr=subprocess.DEVNULL)
+        try:
+            _wait_for(short_socket_path)
+            cli_main.main(["daemon", "--stop"])
+            assert proc.wait(timeout=10) == 0
+        finally:
+            proc.kill()
+        assert capsys.readouterr().out == "Daemon stopped\n"
+        assert not short_socket_path.exists()
+
+
+def test_daemon_refuses_to_replace_regular_file(short_socket_path, capsys):
+    short_socket_path.write_text("important\n")
+    with pytest.raises(SystemExit) as excinfo:
+        cli_main.main(["--socket", str(short_socket_path), "daemon"])
+    assert excinfo.value.code == 1
+    assert "is not a socket" in capsys.readouterr().err
+    assert short_socket_path.read_text() == "important\n"
+
+
+def test_socket_is_created_private(short_socket_path):
+    old_umask = os.umask(0)
+    try:
+        with server.DaemonServer(short_socket_path, service=None):
+            assert short_socket_path.stat().st_mode & 0o777 == 0o600
+    finally:
+        assert os.umask(old_umask) == 0
+
+
+def test_cli_forwarded_download_waits_without_timeout(running_daemon, monkeypatch, capsys, tmp_path):
+    calls = []
+
+    def fake_download(file_id, session=None, output_dir="."):
+        calls.append((file_id, output_dir))
+        return Path(output_dir) / "file.bin"
+
+    monkeypatch.setattr(server, "download_file_by_id", fake_download)
+    real_request = client.request
+    timeouts = []
+
+    def recording_request(*args, **kwargs):
+        timeouts.append(kwargs.get("timeout"))
+        return real_request(*args, **kwargs)
+
+    monkeypatch.setattr(client, "request", recording_request)
+    cli_main.main(["drive-download", "--link", "abc123", "--output", str(tmp_path)])
+
+    captured = capsys.readouterr()
+    assert captured.out.strip() == f"Downloaded to: {tmp_path / 'file.bin'}"
+    assert "handed to the frank-tools daemon" in captured.err
+    assert calls == [("abc123", str(tmp_path))]
+    assert timeouts == [None]
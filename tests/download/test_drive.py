@@ -2,6 +2,7 @@ from pathlib import Path
 
 import pytest
 
+from frank_tools import profiling
 from frank_tools.download import drive
 
 
@@ -70,3 +71,15 @@ def test_download_file_by_id_streams(monkeypatch, tmp_path):
     assert dest.read_bytes() == b"hello"
     assert session.calls[0]["params"] == {"id": "abc123"}
     assert session.calls[1]["params"] == {"id": "abc123", "confirm": "token123"}
+
+
+def test_save_response_content_records_read_and_write_spans(monkeypatch, tmp_path):
+    monkeypatch.setattr(drive, "tqdm", lambda iterable, **_: iterable)
+    tracer = profiling.enable()
+    try:
+        drive.save_response_content(FakeResponse(content=b"hello"), tmp_path / "out.bin")
+    finally:
+        profiling.disable()
+
+    counts = {row["name"]: row["count"] for row in tracer.summary()}
+    assert counts == {"drive.read_chunk": 2, "drive.write_chunk": 1}
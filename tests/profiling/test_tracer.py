@@ -0,0 +1,60 @@
+import json
+
+from frank_tools import profiling
+from frank_tools.profiling import Tracer
+
+
+def test_span_is_noop_when_disabled():
+    profiling.disable()
+    first = profiling.span("anything", size=1)
+    second = profiling.span("other")
+    assert first is second
+    with first:
+        pass
+    assert profiling.get_tracer() is None
+
+
+def test_enabled_tracer_records_spans_and_summary():
+    tracer = profiling.enable()
+    try:
+        for _ in range(3):
+            with profiling.span("work", size=10):
+                pass
+        with profiling.span("other"):
+            pass
+    finally:
+        assert profiling.disable() is tracer
+
+    summary = {row["name"]: row for row in tracer.summary()}
+    assert summary["work"]["count"] == 3
+    assert summary["other"]["count"] == 1
+    table = tracer.summary_table()
+    assert table.splitlines()[0].startswith("span")
+    assert "work" in table and "other" in table
+
+
+def test_write_chrome_trace(tmp_path):
+    tracer = Tracer()
+    with tracer.span("outer", chapter="One"):
+        with tracer.span("inner"):
+            pass
+
+    path = tracer.write_chrome_trace(tmp_path / "trace.json")
+    events = json.loads(path.read_text())["traceEvents"]
+    assert [event["name"] for event in events] == ["outer", "inner"]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["args"] == {"chapter": "One"}
+    assert events[0]["dur"] >= events[1]["dur"]
+
+
+def test_track_overrides_thread_id():
+    tracer = Tracer()
+    with profiling.track(7):
+        with tracer.span("inside"):
+            pass
+    with tracer.span("outside"):
+        pass
+
+    inside, outside = tracer.spans
+    assert inside.track_id == 7
+    assert outside.track_id != 7